@@ -1,16 +1,87 @@
 # google_ads_scraper.py
 from __future__ import annotations
 
-from src.config import ScrapingConfig
+import asyncio
+import itertools
+import logging
+from typing import Awaitable, Callable, Optional
+
+from src.config import ScrapingConfig, TargetsConfig
 from src.models.ad_data import AdData
 
+logger = logging.getLogger(__name__)
+
+SearchFunc = Callable[[str, str], Awaitable[list[AdData]]]
+
+# Failures of a single search: network errors, timeouts and result pages
+# that cannot be parsed into valid ads
+SEARCH_ERRORS = (OSError, asyncio.TimeoutError, ValueError)
+
 class EnhancedGoogleAdsScraper:
     """Google Ads scraper with enhanced features for auto parts"""
     
-    def __init__(self, config: ScrapingConfig):
+    def __init__(
+        self,
+        config: ScrapingConfig,
+        targets: Optional[TargetsConfig] = None,
+        search: Optional[SearchFunc] = None
+    ):
+        """
+        Args:
+            config: Scraping configuration
+            targets: Keywords and locations to scrape
+            search: Coroutine function taking (keyword, location) and
+                returning the ads found for that combination
+                
+        Raises:
+            ValueError: If targets are given without a search function
+        """
+        if targets is not None and search is None:
+            raise ValueError("A search function is required to scrape targets")
         self.config = config
+        self.targets = targets
+        self.search = search
         
     async def scrape(self) -> list[AdData]:
-        """Main scraping method"""
-        # Implementation to be added
-        return []
\ No newline at end of file
+        """
+        Main scraping method
+        
+        Every (keyword, location) combination is scraped as its own task,
+        with at most ``config.max_concurrent`` searches in flight at once.
+        
+        Returns:
+            list[AdData]: Ads found across all targets
+        """
+        if self.targets is None:
+            return []
+
+        semaphore = asyncio.Semaphore(self.config.max_concurrent)
+        batches = await asyncio.gather(*(
+            self._scrape_target(semaphore, keyword, location)
+            for keyword, location in itertools.product(
+                self.targets.keywords, self.targets.locations
+            )
+        ))
+        return [ad for batch in batches for ad in batch]
+
+    async def _scrape_target(
+        self,
+        semaphore: asyncio.Semaphore,
+        keyword: str,
+        location: str
+    ) -> list[AdData]:
+        """
+        Run a single search once a concurrency slot is free
+        
+        A search that fails with a network or parse error is logged and
+        yields no ads, so one bad target does not discard the results of
+        the others. Any other exception propagates.
+        """
+        async with semaphore:
+            try:
+                return await self.search(keyword, location)
+            except SEARCH_ERRORS:
+                logger.exception(
+                    "Search failed for %r in %r", keyword, location
+                )
+                return []
@@ -4,12 +4,44 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
 from logging import FileHandler, Handler, StreamHandler
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import List, Optional, Tuple, Union
-from urllib.parse import urlparse
+import atexit
 import logging
+import queue
 import yaml
 
+from src.utils.urls import parse_url
+
+# Log records are queued by the caller and written by a background listener
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
+
+def shutdown_logging() -> None:
+    """
+    Detach the queue handler, flush queued records and close the handlers
+    
+    Once this returns, nothing is enqueued any more, so records logged
+    afterwards cannot pile up in a queue that nothing drains.
+    """
+    global _log_listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler.close()
+        _queue_handler = None
+    if _log_listener is None:
+        return
+    _log_listener.stop()
+    for handler in _log_listener.handlers:
+        handler.close()
+    _log_listener = None
+
+
+atexit.register(shutdown_logging)
+
 
 class LogLevel(str, Enum):
     """Valid logging levels"""
@@ -20,7 +52,7 @@ class LogLevel(str, Enum):
     CRITICAL = "CRITICAL"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProxyConfig:
     """
     Proxy configuration settings
@@ -59,12 +91,12 @@ class ProxyConfig:
         Raises:
             ValueError: If URL format is invalid
         """
-        result = urlparse(url)
+        result = parse_url(url)
         if not all([result.scheme, result.netloc]):
             raise ValueError(f"Invalid proxy URL: {url}")
 
 
-@dataclass 
+@dataclass(slots=True)
 class LoggingConfig:
     """
     Logging configuration settings
@@ -89,7 +121,7 @@ class LoggingConfig:
                 raise ValueError(f"Invalid logging level: {self.level}") from e
 
 
-@dataclass
+@dataclass(slots=True)
 class TargetsConfig:
     """
     Scraping targets configuration
@@ -113,7 +145,7 @@ class TargetsConfig:
             raise ValueError("All locations must be strings")
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapingConfig:
     """
     Main scraper configuration
@@ -143,6 +175,63 @@ class ScrapingConfig:
     base_url: str = "https://www.google.com"
     output_dir: Path = field(default_factory=lambda: Path("results"))
 
+    @classmethod
+    def from_yaml(cls, path: Union[str, Path]) -> ScrapingConfig:
+        """
+        Load configuration from YAML file
+    
+        Args:
+            path: Path to YAML configuration file
+        
+        Returns:
+            ScrapingConfig: Configuration instance
+        
+        Raises:
+            FileNotFoundError: If config file not found
+            yaml.YAMLError: If YAML format is invalid
+            ValueError: If config content is invalid
+        """
+        config_path = Path(path)
+        if not config_path.exists():
+            raise FileNotFoundError(f"Config file not found: {config_path}")
+        
+        try:
+            with open(config_path, encoding='utf-8') as f:
+                config_dict = yaml.safe_load(f)
+            
+            if not isinstance(config_dict, dict):
+                raise ValueError("Invalid YAML format: must be a dictionary")
+            
+            # Convert nested dicts to dataclass instances
+            if 'proxy' in config_dict:
+                config_dict['proxy'] = ProxyConfig(**config_dict['proxy'])
+            if 'logging' in config_dict:
+                config_dict['logging'] = LoggingConfig(**config_dict['logging'])
+            
+            instance = cls(**config_dict)
+            instance.validate()
+            return instance
+        
+        except yaml.YAMLError:
+            # Re-raise YAML errors directly
+            raise
+        except Exception as e:
+            raise ValueError(f"Error loading config: {str(e)}") from e
+
+    def validate(self) -> None:
+        """Additional validation of config values"""
+        if not isinstance(self.base_url, str):
+            raise ValueError("base_url must be a string")
+        
+        try:
+            result = parse_url(self.base_url)
+            if not all([result.scheme, result.netloc]):
+                raise ValueError(f"Invalid base URL: {self.base_url}")
+            if result.scheme not in ['http', 'https']:
+                raise ValueError(f"Invalid URL scheme: {result.scheme}")
+        except Exception as e:
+            raise ValueError(f"Invalid base URL: {str(e)}")
+
     def __post_init__(self) -> None:
         """Validate and normalize configuration settings"""
         if isinstance(self.output_dir, str):
@@ -155,111 +244,52 @@ class ScrapingConfig:
             raise ValueError("delay_range must have exactly 2 values")
         if self.delay_range[0] > self.delay_range[1]:
             raise ValueError("Invalid delay range")
+        if self.max_concurrent <= 0:
+            raise ValueError("max_concurrent must be positive")
         if not isinstance(self.proxy, ProxyConfig):
             # pylint: disable=not-a-mapping
             self.proxy = ProxyConfig(**self.proxy)
         if not isinstance(self.logging, LoggingConfig):
             # pylint: disable=not-a-mapping
             self.logging = LoggingConfig(**self.logging)
-
-    @classmethod
-def from_yaml(cls, path: Union[str, Path]) -> ScrapingConfig:
-    """
-    Load configuration from YAML file
-    
-    Args:
-        path: Path to YAML configuration file
-        
-    Returns:
-        ScrapingConfig: Configuration instance
-        
-    Raises:
-        FileNotFoundError: If config file not found
-        yaml.YAMLError: If YAML format is invalid
-        ValueError: If config content is invalid
-    """
-    config_path = Path(path)
-    if not config_path.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
-        
-    try:
-        with open(config_path, encoding='utf-8') as f:
-            config_dict = yaml.safe_load(f)
-            
-        if not isinstance(config_dict, dict):
-            raise ValueError("Invalid YAML format: must be a dictionary")
-            
-        # Convert nested dicts to dataclass instances
-        if 'proxy' in config_dict:
-            config_dict['proxy'] = ProxyConfig(**config_dict['proxy'])
-        if 'logging' in config_dict:
-            config_dict['logging'] = LoggingConfig(**config_dict['logging'])
-            
-        instance = cls(**config_dict)
-        instance.validate()
-        return instance
-        
-    except yaml.YAMLError:
-        # Re-raise YAML errors directly
-        raise
-    except Exception as e:
-        raise ValueError(f"Error loading config: {str(e)}") from e
-
-    # Update the validate() method in ScrapingConfig
-def validate(self) -> None:
-    """Additional validation of config values"""
-    if not isinstance(self.base_url, str):
-        raise ValueError("base_url must be a string")
-        
-    try:
-        result = urlparse(self.base_url)
-        if not all([result.scheme, result.netloc]):
-            raise ValueError(f"Invalid base URL: {self.base_url}")
-        if result.scheme not in ['http', 'https']:
-            raise ValueError(f"Invalid URL scheme: {result.scheme}")
-    except Exception as e:
-        raise ValueError(f"Invalid base URL: {str(e)}")
-
-def __post_init__(self) -> None:
-    """Validate and normalize configuration settings"""
-    if isinstance(self.output_dir, str):
-        self.output_dir = Path(self.output_dir)
-    if self.retry_limit <= 0:
-        raise ValueError("retry_limit must be positive")
-    if self.timeout <= 0:
-        raise ValueError("timeout must be positive")
-    if len(self.delay_range) != 2:
-        raise ValueError("delay_range must have exactly 2 values")
-    if self.delay_range[0] > self.delay_range[1]:
-        raise ValueError("Invalid delay range")
-    if not isinstance(self.proxy, ProxyConfig):
-        self.proxy = ProxyConfig(**self.proxy)
-    if not isinstance(self.logging, LoggingConfig):
-        self.logging = LoggingConfig(**self.logging)
-    self.validate()  # Call validate after initialization
+        self.validate()  # Call validate after initialization
 
     def ensure_paths(self) -> None:
         """Ensure required directories exist"""
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-   def setup_logging(self) -> None:
-    """Configure logging based on settings"""
-    # Remove any existing handlers
-    root_logger = logging.getLogger()
-    for handler in root_logger.handlers[:]:
-        handler.close()
-        root_logger.removeHandler(handler)
-        
-    handlers: List[Handler] = []
+    def setup_logging(self) -> None:
+        """
+        Configure logging based on settings
     
-    if self.logging.file:
-        handlers.append(FileHandler(self.logging.file))
-    if self.logging.console:
-        handlers.append(StreamHandler())
+        Loggers hand records to a QueueHandler, which merges the message
+        arguments in the calling thread; a QueueListener thread applies the
+        configured format and writes them, so logging never blocks the
+        scraping tasks on I/O. Calling this again replaces the previous
+        listener and handlers.
+        """
+        global _log_listener, _queue_handler
+        shutdown_logging()
+
+        # Remove any existing handlers
+        root_logger = logging.getLogger()
+        for handler in root_logger.handlers[:]:
+            handler.close()
+            root_logger.removeHandler(handler)
         
-    logging.basicConfig(
-        level=self.logging.level.value,
-        format=self.logging.format,
-        handlers=handlers,
-        force=True
-    )
\ No newline at end of file
+        handlers: List[Handler] = []
+    
+        if self.logging.file:
+            handlers.append(FileHandler(self.logging.file))
+        if self.logging.console:
+            handlers.append(StreamHandler())
+
+        formatter = logging.Formatter(self.logging.format)
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        root_logger.setLevel(self.logging.level.value)
+        _queue_handler = QueueHandler(_log_queue)
+        root_logger.addHandler(_queue_handler)
+        _log_listener = QueueListener(_log_queue, *handlers)
+        _log_listener.start()
\ No newline at end of file
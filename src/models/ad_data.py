@@ -1,12 +1,13 @@
 # src/models/ad_data.py
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Any, Dict, Optional, List
-from urllib.parse import urlparse
+from typing import Any, Dict, Iterable, Optional, List
 from enum import Enum, auto
 
+from src.utils.urls import parse_url
+
 
 class AdPosition(Enum):
     """Enumeration for ad positions"""
@@ -31,7 +32,7 @@ class URLValidationError(ValueError):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class AdData:
     """
     Data model for European auto parts advertisement information.
@@ -108,7 +109,7 @@ class AdData:
             URLValidationError: If URL is invalid
         """
         try:
-            result = urlparse(url)
+            result = parse_url(url)
             if not all([result.scheme, result.netloc]):
                 raise URLValidationError("Invalid URL format: Missing scheme or domain")
             if not result.scheme in ['http', 'https']:
@@ -146,24 +147,9 @@ class AdData:
         Returns:
             Dict[str, Any]: Dictionary of ad data
         """
-        return {
-            'keyword': self.keyword,
-            'location': self.location,
-            'website_url': self.website_url,
-            'title': self.title,
-            'description': self.description,
-            'phone_number': self.phone_number,
-            'price': self.price,
-            'email': self.email,
-            'social_links': self.social_links,
-            'meta_tags': self.meta_tags,
-            'ad_position': self.ad_position.name,
-            'timestamp': self.timestamp,
-            'product_categories': self.product_categories,
-            'brand': self.brand,
-            'model': self.model,
-            'part_condition': self.part_condition
-        }
+        data = {name: getattr(self, name) for name in _AD_FIELDS}
+        data['ad_position'] = self.ad_position.name
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> AdData:
@@ -185,6 +171,31 @@ class AdData:
                 
         return cls(**data)
 
+    @classmethod
+    def columns(cls, ads: Iterable[AdData]) -> Dict[str, List[Any]]:
+        """
+        Pivot ads into one list per field for columnar export
+        
+        Args:
+            ads: Ads to pivot
+            
+        Returns:
+            Dict[str, List[Any]]: Column values keyed by field name, in the
+                same format as to_dict()
+        """
+        columns: Dict[str, List[Any]] = {name: [] for name in _AD_FIELDS}
+        appenders = [(name, column.append) for name, column in columns.items()]
+        for ad in ads:
+            for name, append in appenders:
+                append(getattr(ad, name))
+        columns['ad_position'] = [
+            position.name for position in columns['ad_position']
+        ]
+        return columns
+
     def __str__(self) -> str:
         """String representation of the ad"""
-        return f"{self.title} - {self.website_url} ({self.ad_position.name})"
\ No newline at end of file
+        return f"{self.title} - {self.website_url} ({self.ad_position.name})"
+
+
+_AD_FIELDS = tuple(f.name for f in fields(AdData))
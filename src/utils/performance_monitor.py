@@ -2,11 +2,10 @@
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Deque, Dict, Optional
-import statistics
+from typing import Deque, Dict, Optional, Tuple
 import time
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceStats:
     """Container for performance statistics"""
     avg_time: float = 0.0
@@ -29,11 +28,37 @@ class PerformanceMonitor:
         self.total_requests = 0
         self.successful_requests = 0
         self._last_stats: Optional[PerformanceStats] = None
+        # Running aggregates over the current window
+        self._window_time = 0.0
+        self._window_successes = 0
+        # Monotonic (sequence, duration) queues for sliding min/max
+        self._min_times: Deque[Tuple[int, float]] = deque()
+        self._max_times: Deque[Tuple[int, float]] = deque()
 
     def add_scrape(self, duration: float, success: bool) -> None:
         """Record a scraping operation"""
+        if self.scrape_times and len(self.scrape_times) == self.window_size:
+            # Oldest entry is about to be evicted from the window
+            self._window_time -= self.scrape_times[0]
+            self._window_successes -= self.success_history[0]
         self.scrape_times.append(duration)
         self.success_history.append(success)
+        self._window_time += duration
+        self._window_successes += success
+
+        seq = self.total_requests
+        oldest = seq - self.window_size
+        while self._min_times and self._min_times[-1][1] >= duration:
+            self._min_times.pop()
+        self._min_times.append((seq, duration))
+        if self._min_times[0][0] <= oldest:
+            self._min_times.popleft()
+        while self._max_times and self._max_times[-1][1] <= duration:
+            self._max_times.pop()
+        self._max_times.append((seq, duration))
+        if self._max_times[0][0] <= oldest:
+            self._max_times.popleft()
+
         self.total_requests += 1
         if success:
             self.successful_requests += 1
@@ -49,10 +74,10 @@ class PerformanceMonitor:
 
         elapsed = (datetime.now() - self.start_time).total_seconds() / 60
         stats = PerformanceStats(
-            avg_time=statistics.mean(self.scrape_times),
-            min_time=min(self.scrape_times),
-            max_time=max(self.scrape_times),
-            success_rate=sum(self.success_history) / len(self.success_history),
+            avg_time=self._window_time / len(self.scrape_times),
+            min_time=self._min_times[0][1],
+            max_time=self._max_times[0][1],
+            success_rate=self._window_successes / len(self.success_history),
             total_requests=self.total_requests,
             successful_requests=self.successful_requests,
             requests_per_minute=self.total_requests / max(1, elapsed),
@@ -85,4 +110,8 @@ class PerformanceMonitor:
         self.start_time = datetime.now()
         self.total_requests = 0
         self.successful_requests = 0
-        self._last_stats = None
\ No newline at end of file
+        self._last_stats = None
+        self._window_time = 0.0
+        self._window_successes = 0
+        self._min_times.clear()
+        self._max_times.clear()
\ No newline at end of file
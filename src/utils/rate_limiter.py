@@ -1,19 +1,39 @@
 # src/utils/rate_limiter.py
 import asyncio
+import math
 import time
+import warnings
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from itertools import repeat
+from typing import Deque, Optional
 import logging
 
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
-@dataclass
+# Age span of request timestamps kept for get_request_count
+HISTORY_MAX_AGE = 3600
+
+NS_PER_SECOND = 1_000_000_000
+# Tokens are tracked in thousandths so fractional refills stay integral
+TOKEN_SCALE = 1000
+# Throttling is logged at most once per interval to avoid flooding the log
+LOG_INTERVAL_NS = NS_PER_SECOND
+
+@dataclass(frozen=True, slots=True)
 class RateLimiterConfig:
-    """Configuration for rate limiting"""
+    """
+    Configuration for rate limiting
+    
+    min_delay is deprecated and ignored: waiting callers sleep exactly
+    until their tokens are due. A non-zero value emits a
+    DeprecationWarning.
+    """
     max_requests: int = field(default=10)
     time_window: int = field(default=60)
-    min_delay: float = field(default=0.1)
+    min_delay: float = field(default=0.0)
     burst_size: int = field(default=3)
 
     def __post_init__(self):
@@ -26,121 +46,221 @@ class RateLimiterConfig:
             raise ValueError("min_delay cannot be negative")
         if self.burst_size < 0:
             raise ValueError("burst_size cannot be negative")
+        if self.min_delay:
+            warnings.warn(
+                "RateLimiterConfig.min_delay is deprecated and has no effect",
+                DeprecationWarning,
+                stacklevel=3
+            )
 
 class RateLimiter:
     """Async rate limiter using token bucket algorithm"""
 
+    __slots__ = (
+        'config', 'request_history', '_closed', '_tokens_millis', '_last_ns',
+        '_rate_num', '_rate_den', '_capacity', '_last_log_ns'
+    )
+
     def __init__(self, config: RateLimiterConfig):
         self.config = config
-        self.tokens = float(config.max_requests)  # Use float for better precision
-        self.last_update = time.monotonic()
-        self.lock = asyncio.Lock()
-        self.request_history: Dict[str, float] = {}  # Use monotonic time
+        # Monotonic ns timestamps. At most this many tokens can be granted
+        # within HISTORY_MAX_AGE, so a full deque only evicts older entries.
+        # The bound is roughly rate * HISTORY_MAX_AGE entries: about 3.6M
+        # ints for a limiter allowing 1000 requests per second.
+        history_size = config.max_requests + config.burst_size + math.ceil(
+            config.max_requests * HISTORY_MAX_AGE / config.time_window
+        )
+        self.request_history: Deque[int] = deque(maxlen=history_size)
         self._closed = False
+        self._tokens_millis = config.max_requests * TOKEN_SCALE
+        self._last_ns = time.monotonic_ns()
+        # Derived once; the config does not change after construction.
+        # The refill rate is _rate_num milli-tokens per _rate_den nanoseconds.
+        self._rate_num = config.max_requests * TOKEN_SCALE
+        self._rate_den = int(config.time_window * NS_PER_SECOND)
+        self._capacity = (config.max_requests + config.burst_size) * TOKEN_SCALE
+        self._last_log_ns = self._last_ns - LOG_INTERVAL_NS
+
+    @property
+    def tokens(self) -> float:
+        """Token balance as of the last update; negative while callers wait"""
+        return self._tokens_millis / TOKEN_SCALE
+
+    @property
+    def last_update(self) -> float:
+        """Monotonic time in seconds of the last bucket update"""
+        return self._last_ns / NS_PER_SECOND
 
     async def acquire(self, key: Optional[str] = None) -> None:
-        """Acquire a token for making a request"""
-        if self._closed:
-            raise RuntimeError("Rate limiter is closed")
+        """
+        Acquire a token for making a request
+        
+        When a token is available it is taken synchronously and nothing is
+        awaited; otherwise the caller sleeps until its reserved token is due.
+        """
+        wait_ns = self._reserve(1, key)
+        if wait_ns is not None:
+            await self._wait(wait_ns, 1, key)
 
-        try:
-            async with self.lock:
-                await self._refill_tokens()
+    def try_acquire(self, key: Optional[str] = None) -> bool:
+        """
+        Take a token only if one is available right now
+        
+        Args:
+            key: Optional request key; keyed requests are counted by
+                get_request_count
                 
-                while self.tokens <= 0:
-                    delay = self._calculate_delay()
-                    await asyncio.sleep(delay)
-                    await self._refill_tokens()
+        Returns:
+            bool: True if a token was taken, False otherwise
+        """
+        return self.allow_n(1, key)
+
+    async def acquire_n(self, n: int, key: Optional[str] = None) -> None:
+        """
+        Acquire n tokens at once, waiting until all of them are available
+        
+        The tokens are reserved immediately, letting the balance go negative
+        while callers wait for tokens that have not accrued yet. Each waiter
+        sleeps once, until the moment its tokens are due, so waiters are
+        served in arrival order without polling.
+        
+        Args:
+            n: Number of tokens to acquire
+            key: Optional request key; keyed requests are counted by
+                get_request_count
                 
-                self.tokens -= 1
-                if key is not None:
-                    self.request_history[key] = time.monotonic()
-                    
-        except Exception as e:
-            logger.error(f"Error acquiring token: {str(e)}")
-            raise
+        Raises:
+            RuntimeError: If the limiter is closed
+            ValueError: If n is not positive
+        """
+        wait_ns = self._reserve(n, key)
+        if wait_ns is not None:
+            await self._wait(wait_ns, n, key)
 
-    async def _refill_tokens(self) -> None:
-        """Refill tokens based on elapsed time"""
-        try:
-            now = time.monotonic()
-            time_passed = now - self.last_update
-            
-            token_increment = time_passed * (
-                self.config.max_requests / self.config.time_window
-            )
-            
-            self.tokens = min(
-                float(self.config.max_requests + self.config.burst_size),
-                self.tokens + token_increment
+    def _reserve(self, n: int, key: Optional[str]) -> Optional[int]:
+        """
+        Reserve n tokens, sampling the clock once
+        
+        Returns:
+            Optional[int]: None if the tokens were granted immediately,
+                otherwise the nanoseconds until they are due
+        """
+        if self._closed:
+            raise RuntimeError("Rate limiter is closed")
+        if n <= 0:
+            raise ValueError("n must be positive")
+
+        cost = n * TOKEN_SCALE
+        now = time.monotonic_ns()
+        tokens = self._refill(now)
+        self._tokens_millis = tokens - cost
+        if tokens >= cost:
+            if key is not None:
+                self.request_history.extend(repeat(now, n))
+            return None
+
+        # Time until the deficit accrues, less progress already carried
+        deficit = cost - tokens
+        wait_ns = -(-deficit * self._rate_den // self._rate_num)
+        wait_ns -= now - self._last_ns
+        if (now - self._last_log_ns >= LOG_INTERVAL_NS
+                and logger.isEnabledFor(logging.DEBUG)):
+            self._last_log_ns = now
+            logger.debug(
+                "Rate limit reached, waiting %.3fs for %d token(s)",
+                wait_ns / NS_PER_SECOND,
+                n,
+                extra={'key': key}
             )
-            self.last_update = now
-            
-        except Exception as e:
-            logger.error(f"Error refilling tokens: {str(e)}")
-            raise
+        return wait_ns
 
-    def _calculate_delay(self) -> float:
-        """Calculate delay needed before next token"""
+    async def _wait(self, wait_ns: int, n: int, key: Optional[str]) -> None:
+        """Sleep until reserved tokens are due, returning them if cancelled"""
         try:
-            tokens_needed = 1
-            token_generation_rate = self.config.max_requests / self.config.time_window
-            delay = max(
-                tokens_needed / token_generation_rate,
-                self.config.min_delay
-            )
-            return delay
-            
-        except Exception as e:
-            logger.error(f"Error calculating delay: {str(e)}")
+            await asyncio.sleep(wait_ns / NS_PER_SECOND)
+        except asyncio.CancelledError:
+            self._tokens_millis += n * TOKEN_SCALE  # Hand the reservation back
             raise
+        if key is not None:
+            self.request_history.extend(repeat(time.monotonic_ns(), n))
+
+    def allow_n(self, n: int, key: Optional[str] = None) -> bool:
+        """
+        Take n tokens only if they are available right now
+        
+        Args:
+            n: Number of tokens to take
+            key: Optional request key; keyed requests are counted by
+                get_request_count
+                
+        Returns:
+            bool: True if the tokens were taken, False otherwise
+            
+        Raises:
+            RuntimeError: If the limiter is closed
+            ValueError: If n is not positive
+        """
+        if self._closed:
+            raise RuntimeError("Rate limiter is closed")
+        if n <= 0:
+            raise ValueError("n must be positive")
+
+        cost = n * TOKEN_SCALE
+        now = time.monotonic_ns()
+        tokens = self._refill(now)
+        if tokens < cost:
+            return False
+        self._tokens_millis = tokens - cost
+        if key is not None:
+            self.request_history.extend(repeat(now, n))
+        return True
+
+    def _refill(self, now: int) -> int:
+        """Credit tokens earned since the last update and return the balance"""
+        rate_num = self._rate_num
+        earned, remainder = divmod(
+            (now - self._last_ns) * rate_num, self._rate_den
+        )
+        tokens = self._tokens_millis + earned
+        if tokens >= self._capacity:
+            tokens = self._capacity
+            self._last_ns = now
+        else:
+            # Carry over time that has not yet produced a whole milli-token
+            self._last_ns = now - remainder // rate_num
+        self._tokens_millis = tokens
+        return tokens
 
     def get_request_count(self, window_seconds: Optional[int] = None) -> int:
         """Get number of requests in time window"""
-        try:
-            if not window_seconds:
-                window_seconds = self.config.time_window
-                
-            now = time.monotonic()
-            count = sum(
-                1 for timestamp in self.request_history.values()
-                if (now - timestamp) <= window_seconds
-            )
-            return count
+        if not window_seconds:
+            window_seconds = self.config.time_window
             
-        except Exception as e:
-            logger.error(f"Error getting request count: {str(e)}")
-            raise
+        # Timestamps are appended in order, so walk back from the newest;
+        # deque indexing is O(N/64), which rules out bisecting it
+        cutoff = time.monotonic_ns() - int(window_seconds * NS_PER_SECOND)
+        count = 0
+        for timestamp in reversed(self.request_history):
+            if timestamp < cutoff:
+                break
+            count += 1
+        return count
 
     async def __aenter__(self):
-        """Async context manager entry"""
+        """
+        Async context manager entry; acquires one token
+        
+        Lets each rate-limited block be written as ``async with limiter:``.
+        The limiter stays open afterwards; call close() when done with it.
+        """
         if self._closed:
             raise RuntimeError("Cannot enter closed rate limiter")
+        await self.acquire()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit"""
-        await self.close()
+        """Async context manager exit; tokens are not returned"""
 
     async def close(self) -> None:
         """Close rate limiter and cleanup resources"""
-        if not self._closed:
-            try:
-                async with self.lock:
-                    self.cleanup_history()
-                    self._closed = True
-            except Exception as e:
-                logger.error(f"Error closing rate limiter: {str(e)}")
-                raise
-
-    def cleanup_history(self, max_age: int = 3600) -> None:
-        """Clean up old request history entries"""
-        try:
-            now = time.monotonic()
-            self.request_history = {
-                k: v for k, v in self.request_history.items()
-                if (now - v) <= max_age
-            }
-        except Exception as e:
-            logger.error(f"Error cleaning history: {str(e)}")
-            raise
\ No newline at end of file
+        self._closed = True
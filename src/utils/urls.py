@@ -0,0 +1,20 @@
+# src/utils/urls.py
+from functools import lru_cache
+from urllib.parse import ParseResult, urlparse
+
+
+@lru_cache(maxsize=4096)
+def parse_url(url: str) -> ParseResult:
+    """
+    Parse a URL, reusing the result for URLs seen before
+    
+    Args:
+        url: URL string to parse
+        
+    Returns:
+        ParseResult: Parsed URL components
+        
+    Raises:
+        ValueError: If the URL cannot be parsed
+    """
+    return urlparse(url)
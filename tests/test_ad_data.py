@@ -0,0 +1,59 @@
+import pytest
+
+from src.models.ad_data import AdData, AdPosition
+
+
+@pytest.fixture
+def ads():
+    return [
+        AdData(
+            keyword="bmw brake pads",
+            location="Germany",
+            website_url="https://parts.example.de",
+            title="BMW Bremsbeläge",
+            phone_number="+49 30 1234567",
+            ad_position=AdPosition.TOP,
+            product_categories=["brakes"]
+        ),
+        AdData(
+            keyword="audi headlights",
+            location="UK",
+            website_url="https://parts.example.co.uk",
+            title="Audi Headlights"
+        ),
+    ]
+
+
+def test_columns_match_to_dict(ads):
+    columns = AdData.columns(ads)
+    rows = [ad.to_dict() for ad in ads]
+
+    assert list(columns) == list(rows[0])
+    for name, values in columns.items():
+        assert values == [row[name] for row in rows]
+    assert columns['ad_position'] == ['TOP', 'UNKNOWN']
+
+
+def test_columns_empty_input():
+    columns = AdData.columns([])
+    assert list(columns) == list(AdData.__dataclass_fields__)
+    assert all(values == [] for values in columns.values())
+
+
+def test_to_dict_round_trip(ads):
+    ad = ads[0]
+    data = ad.to_dict()
+
+    assert list(data) == [
+        'keyword', 'location', 'website_url', 'title', 'description',
+        'phone_number', 'price', 'email', 'social_links', 'meta_tags',
+        'ad_position', 'timestamp', 'product_categories', 'brand', 'model',
+        'part_condition'
+    ]
+    assert data['ad_position'] == 'TOP'
+    assert data['phone_number'] == '49301234567'
+    assert AdData.from_dict(dict(data)) == ad
+
+
+def test_ad_data_uses_slots(ads):
+    assert not hasattr(ads[0], '__dict__')
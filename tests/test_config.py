@@ -3,13 +3,17 @@ import pytest
 from pathlib import Path
 import logging
 import yaml
+from logging.handlers import QueueHandler
 from tempfile import TemporaryDirectory
 
+import src.config as src_config
+
 from src.config import (
     ProxyConfig,
     LoggingConfig, 
     TargetsConfig,
-    ScrapingConfig
+    ScrapingConfig,
+    shutdown_logging
 )
 
 
@@ -104,6 +108,11 @@ def valid_yaml_config():
     """
 
 
+@pytest.fixture
+def config_file(tmp_path):
+    return str(tmp_path / "config.yaml")
+
+
 @pytest.fixture
 def temp_config_file(valid_yaml_config):
     with TemporaryDirectory() as tmpdir:
@@ -162,6 +171,8 @@ def test_setup_logging():
             
             test_logger = logging.getLogger("test")
             test_logger.info("Test message")
+            # Drain the queue listener so the record reaches the file
+            shutdown_logging()
             
             assert log_file.exists()
             with open(log_file, 'r') as f:
@@ -174,6 +185,20 @@ def test_setup_logging():
                 root_logger.removeHandler(handler)
 
 
+def test_shutdown_logging_detaches_queue_handler():
+    config = ScrapingConfig()
+    config.logging.file = None
+    config.logging.console = False
+    config.setup_logging()
+    shutdown_logging()
+
+    root_logger = logging.getLogger()
+    assert not any(isinstance(h, QueueHandler) for h in root_logger.handlers)
+    for _ in range(10):
+        logging.getLogger("test").warning("after shutdown")
+    assert src_config._log_queue.qsize() == 0
+
+
 def test_invalid_yaml_file():
     with pytest.raises(FileNotFoundError):
         ScrapingConfig.from_yaml("nonexistent.yaml")
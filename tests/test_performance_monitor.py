@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+from src.utils.performance_monitor import PerformanceMonitor, PerformanceStats
+
+
+def test_empty_monitor_returns_default_stats():
+    monitor = PerformanceMonitor()
+    stats = monitor.get_stats()
+    assert isinstance(stats, PerformanceStats)
+    assert stats.total_requests == 0
+
+
+def test_stats_track_sliding_window():
+    monitor = PerformanceMonitor(window_size=3)
+    for duration, success in [(5.0, True), (1.0, False), (3.0, True), (2.0, True)]:
+        monitor.add_scrape(duration, success)
+
+    stats = monitor.get_stats()
+    # Only the last three scrapes remain in the window
+    assert stats.avg_time == pytest.approx(2.0)
+    assert stats.min_time == 1.0
+    assert stats.max_time == 3.0
+    assert stats.success_rate == pytest.approx(2 / 3)
+    assert stats.total_requests == 4
+    assert stats.successful_requests == 3
+
+
+def test_stats_match_full_recompute():
+    rng = random.Random(42)
+    monitor = PerformanceMonitor(window_size=10)
+    for _ in range(200):
+        monitor.add_scrape(rng.uniform(0.1, 5.0), rng.random() < 0.7)
+        stats = monitor.get_stats()
+        window = list(monitor.scrape_times)
+        assert stats.avg_time == pytest.approx(sum(window) / len(window))
+        assert stats.min_time == min(window)
+        assert stats.max_time == max(window)
+        assert stats.success_rate == pytest.approx(
+            sum(monitor.success_history) / len(monitor.success_history)
+        )
+
+
+def test_reset_clears_window():
+    monitor = PerformanceMonitor(window_size=5)
+    monitor.add_scrape(10.0, True)
+    monitor.reset()
+    monitor.add_scrape(1.0, False)
+
+    stats = monitor.get_stats()
+    assert stats.min_time == stats.max_time == stats.avg_time == 1.0
+    assert stats.success_rate == 0.0
+    assert stats.total_requests == 1
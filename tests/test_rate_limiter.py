@@ -0,0 +1,255 @@
+import asyncio
+import time
+
+import pytest
+
+from src.utils.rate_limiter import (
+    NS_PER_SECOND,
+    RateLimiter,
+    RateLimiterConfig
+)
+
+
+@pytest.fixture
+def limiter():
+    config = RateLimiterConfig(
+        max_requests=10,
+        time_window=1,
+        min_delay=0.0,
+        burst_size=0
+    )
+    return RateLimiter(config)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Freeze the limiter's clock and record how long each waiter sleeps"""
+    recorded = []
+    real_sleep = asyncio.sleep
+    now = time.monotonic_ns()
+
+    async def recording_sleep(delay):
+        recorded.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(time, "monotonic_ns", lambda: now)
+    monkeypatch.setattr(asyncio, "sleep", recording_sleep)
+    return recorded
+
+
+def test_rate_limiter_config_validation():
+    with pytest.raises(ValueError):
+        RateLimiterConfig(max_requests=0)
+    with pytest.raises(ValueError):
+        RateLimiterConfig(time_window=0)
+    with pytest.raises(ValueError):
+        RateLimiterConfig(min_delay=-1)
+    with pytest.raises(ValueError):
+        RateLimiterConfig(burst_size=-1)
+
+
+@pytest.mark.asyncio
+async def test_acquire_consumes_token(limiter):
+    await limiter.acquire()
+    assert limiter.tokens == pytest.approx(9, abs=0.1)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_acquires_do_not_wait_when_tokens_available(
+    limiter, sleeps
+):
+    await asyncio.gather(*(limiter.acquire() for _ in range(10)))
+    assert sleeps == []
+    assert limiter.tokens == 0
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_refill(limiter, sleeps):
+    for _ in range(10):
+        await limiter.acquire()
+
+    await limiter.acquire()
+    # One token at 10 requests/second takes 0.1s to accrue
+    assert sleeps == [pytest.approx(0.1)]
+
+
+@pytest.mark.asyncio
+async def test_wait_is_not_padded_to_min_delay(sleeps):
+    with pytest.warns(DeprecationWarning):
+        config = RateLimiterConfig(
+            max_requests=10,
+            time_window=1,
+            min_delay=1.0,
+            burst_size=0
+        )
+    limiter = RateLimiter(config)
+    for _ in range(10):
+        await limiter.acquire()
+
+    await limiter.acquire()
+    assert sleeps == [pytest.approx(0.1)]
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_scheduled_at_their_token_deadline(limiter, sleeps):
+    for _ in range(10):
+        await limiter.acquire()
+
+    await asyncio.gather(*(limiter.acquire() for _ in range(3)))
+    # Each waiter sleeps until its own token is due, 0.1s apart
+    assert sleeps == [
+        pytest.approx(0.1), pytest.approx(0.2), pytest.approx(0.3)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_returns_its_reservation(limiter):
+    for _ in range(10):
+        await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.tokens < 0
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert limiter.tokens == pytest.approx(0, abs=0.1)
+
+
+@pytest.mark.asyncio
+async def test_request_count(limiter):
+    await limiter.acquire(key="a")
+    await limiter.acquire(key="b")
+    await limiter.acquire()
+    assert limiter.get_request_count() == 2
+
+
+@pytest.mark.asyncio
+async def test_request_count_includes_repeated_keys(limiter):
+    for _ in range(3):
+        await limiter.acquire(key="same")
+    assert limiter.get_request_count() == 3
+
+
+@pytest.mark.asyncio
+async def test_request_count_respects_window(limiter):
+    await limiter.acquire(key="old")
+    await asyncio.sleep(0.2)
+    await limiter.acquire(key="new")
+    assert limiter.get_request_count(window_seconds=0.1) == 1
+    assert limiter.get_request_count() == 2
+
+
+@pytest.mark.asyncio
+async def test_closed_limiter_rejects_acquire(limiter):
+    await limiter.close()
+    with pytest.raises(RuntimeError):
+        await limiter.acquire()
+
+
+@pytest.mark.asyncio
+async def test_acquire_n_takes_tokens_in_one_call(limiter):
+    await limiter.acquire_n(4, key="batch")
+    assert limiter.tokens == pytest.approx(6, abs=0.1)
+    assert limiter.get_request_count() == 4
+
+
+@pytest.mark.asyncio
+async def test_acquire_n_waits_for_whole_batch(limiter, sleeps):
+    await limiter.acquire_n(10)
+    await limiter.acquire_n(3)
+    assert sleeps == [pytest.approx(0.3)]
+
+
+@pytest.mark.asyncio
+async def test_acquire_n_rejects_non_positive(limiter):
+    with pytest.raises(ValueError):
+        await limiter.acquire_n(0)
+
+
+def test_allow_n(limiter):
+    assert limiter.allow_n(8)
+    assert not limiter.allow_n(5)
+    assert limiter.tokens == pytest.approx(2, abs=0.1)
+    assert limiter.allow_n(2)
+
+
+@pytest.mark.asyncio
+async def test_context_manager_acquires_token(limiter):
+    async with limiter:
+        assert limiter.tokens == pytest.approx(9, abs=0.1)
+    async with limiter:
+        pass
+    assert limiter.tokens == pytest.approx(8, abs=0.1)
+
+
+@pytest.mark.asyncio
+async def test_context_manager_rejects_closed_limiter(limiter):
+    await limiter.close()
+    with pytest.raises(RuntimeError):
+        async with limiter:
+            pass
+
+
+@pytest.mark.asyncio
+async def test_waiting_acquire_samples_clock_once_before_sleeping(
+    limiter, monkeypatch
+):
+    for _ in range(10):
+        limiter.try_acquire()
+
+    calls = 0
+    real_monotonic_ns = time.monotonic_ns
+
+    def counting_monotonic_ns():
+        nonlocal calls
+        calls += 1
+        return real_monotonic_ns()
+
+    monkeypatch.setattr(time, "monotonic_ns", counting_monotonic_ns)
+    await limiter.acquire()
+    assert calls == 1
+
+
+def test_try_acquire(limiter):
+    for _ in range(10):
+        assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+
+
+def test_rate_limiter_config_is_immutable():
+    config = RateLimiterConfig()
+    with pytest.raises(AttributeError):
+        config.max_requests = 100
+
+
+def test_request_history_evicts_oldest_when_full(monkeypatch):
+    clock = 0
+
+    def fake_monotonic_ns():
+        return clock
+
+    monkeypatch.setattr(time, "monotonic_ns", fake_monotonic_ns)
+    # One token per 1800s; at most 4 tokens can be granted per hour
+    limiter = RateLimiter(RateLimiterConfig(
+        max_requests=2,
+        time_window=3600,
+        burst_size=0
+    ))
+    assert limiter.try_acquire(key="a")
+    assert limiter.try_acquire(key="a")
+    for _ in range(3):
+        clock += 1800 * NS_PER_SECOND
+        assert limiter.try_acquire(key="a")
+
+    # Five requests were recorded; one of the two from t=0 has been evicted
+    assert len(limiter.request_history) == 4
+    assert limiter.request_history[0] == 0
+    assert limiter.get_request_count(window_seconds=3600) == 3
+    assert limiter.get_request_count(window_seconds=1) == 1
+
+    clock += 1800 * NS_PER_SECOND
+    assert limiter.try_acquire(key="a")
+    assert len(limiter.request_history) == 4
+    assert limiter.request_history[0] == 1800 * NS_PER_SECOND
+    assert limiter.get_request_count(window_seconds=3600) == 3
@@ -1,6 +1,8 @@
 # tests/test_scraper.py
+import asyncio
+
 import pytest
-from src.config import ScrapingConfig
+from src.config import ScrapingConfig, TargetsConfig
 from src.models.ad_data import AdData
 from google_ads_scraper import EnhancedGoogleAdsScraper
 
@@ -18,4 +20,80 @@ async def test_scraper_initialization(scraper):
 async def test_scraper_basic_scrape(scraper):
     results = await scraper.scrape()
     assert isinstance(results, list)
-    # More assertions to be added as implementation grows
\ No newline at end of file
+    # More assertions to be added as implementation grows
+
+@pytest.mark.asyncio
+async def test_scraper_scrapes_all_targets_concurrently():
+    config = ScrapingConfig(max_concurrent=2)
+    targets = TargetsConfig(
+        keywords=["bmw brake pads", "audi headlights"],
+        locations=["Germany", "UK", "France"]
+    )
+    seen = []
+    in_flight = 0
+    peak = 0
+
+    async def fake_search(keyword, location):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        seen.append((keyword, location))
+        return [AdData(
+            keyword=keyword,
+            location=location,
+            website_url="https://example.com",
+            title="Example"
+        )]
+
+    scraper = EnhancedGoogleAdsScraper(config, targets, search=fake_search)
+    results = await scraper.scrape()
+
+    assert len(results) == 6
+    assert sorted(seen) == sorted(
+        (k, l) for k in targets.keywords for l in targets.locations
+    )
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_search_does_not_discard_other_targets():
+    targets = TargetsConfig(keywords=["bmw brake pads"], locations=["Germany", "UK"])
+
+    async def flaky_search(keyword, location):
+        if location == "UK":
+            raise ConnectionResetError("blocked")
+        return [AdData(
+            keyword=keyword,
+            location=location,
+            website_url="https://example.com",
+            title="Example"
+        )]
+
+    scraper = EnhancedGoogleAdsScraper(
+        ScrapingConfig(), targets, search=flaky_search
+    )
+    results = await scraper.scrape()
+
+    assert [ad.location for ad in results] == ["Germany"]
+
+
+@pytest.mark.asyncio
+async def test_programming_errors_in_search_propagate():
+    targets = TargetsConfig(keywords=["bmw brake pads"], locations=["Germany"])
+
+    async def broken_search(keyword, location):
+        raise NotImplementedError
+
+    scraper = EnhancedGoogleAdsScraper(
+        ScrapingConfig(), targets, search=broken_search
+    )
+    with pytest.raises(NotImplementedError):
+        await scraper.scrape()
+
+
+def test_targets_require_a_search_function():
+    targets = TargetsConfig(keywords=["bmw brake pads"], locations=["Germany"])
+    with pytest.raises(ValueError):
+        EnhancedGoogleAdsScraper(ScrapingConfig(), targets)
@@ -0,0 +1,48 @@
+# tests/test_urls.py
+import pytest
+
+from src.config import ProxyConfig, ScrapingConfig
+from src.models.ad_data import AdData, URLValidationError
+from src.utils.urls import parse_url
+
+
+def test_parse_url_components():
+    result = parse_url("https://parts.example.de/bremsen?page=2")
+    assert result.scheme == "https"
+    assert result.netloc == "parts.example.de"
+    assert result.path == "/bremsen"
+    assert result.query == "page=2"
+
+
+def test_parse_url_reuses_cached_result():
+    parse_url.cache_clear()
+    first = parse_url("https://cached.example.com")
+    second = parse_url("https://cached.example.com")
+    assert first is second
+    assert parse_url.cache_info().hits == 1
+
+
+def test_parse_url_does_not_cache_errors():
+    with pytest.raises(ValueError):
+        parse_url("http://[::1")
+    with pytest.raises(ValueError):
+        parse_url("http://[::1")
+
+
+def test_ad_data_rejects_invalid_urls():
+    with pytest.raises(URLValidationError):
+        AdData(keyword="k", location="l", website_url="not-a-url", title="t")
+    with pytest.raises(URLValidationError):
+        AdData(keyword="k", location="l", website_url="ftp://x.com", title="t")
+    with pytest.raises(URLValidationError):
+        AdData(keyword="k", location="l", website_url="http://[::1", title="t")
+
+
+def test_proxy_config_rejects_invalid_url():
+    with pytest.raises(ValueError):
+        ProxyConfig(enabled=True, urls=["proxy.example.com"])
+
+
+def test_scraping_config_rejects_invalid_base_url():
+    with pytest.raises(ValueError):
+        ScrapingConfig(base_url="ftp://www.google.com")